@@ -26,16 +26,26 @@ tool calls) and prints the reply; voice is the primary path for audio playback.
 """
 
 import argparse
+import ctypes
+import fcntl
+import functools
 import io
+import multiprocessing
 import os
+import queue
+import secrets
+import selectors
+import shutil
 import signal
 import subprocess
 import sys
 import threading
 import time
-import uuid
+import traceback
 import wave
+from multiprocessing.connection import Connection
 from pathlib import Path
+from typing import Callable
 
 # ── Load .env before importing config ────────────────────────────────────────
 
@@ -54,9 +64,9 @@ def _load_env() -> str:
 _ENV_PATH = _load_env()
 
 import nia_voice_core.config as nia_config  # noqa: E402 — must load after dotenv
-from nia_voice_core.hub import NiaHubClient        # noqa: E402
-from nia_voice_core.mic import MicCapture          # noqa: E402
-from nia_voice_core.wakeword import OpenWakeWordEngine  # noqa: E402
+
+# hub / mic / wakeword are imported lazily where used: they pull in
+# sounddevice and onnxruntime, which would make `nia-mac --help` slow.
 
 # ── Terminal colours ──────────────────────────────────────────────────────────
 
@@ -69,41 +79,296 @@ _Y   = "\033[93m"  # yellow
 _RED = "\033[91m"  # red
 
 
-def _status(icon: str, colour: str, msg: str):
-    """Overwrite current line with a coloured status message."""
-    print(f"\r{colour}{_B}{icon}  {msg}{_R}          ", flush=True)
+# Serialises terminal writes from the main loop and worker threads so status
+# lines from wake-word / pipeline threads never interleave with the prompt.
+_TTY_LOCK = threading.RLock()
+
+
+_HR = f"{_DIM}{'─' * 50}{_R}"
+
+
+def _status_template(icon: str, colour: str) -> str:
+    return f"\r{colour}{_B}{icon}  %s{_R}          \n"
+
+
+# Pre-formatted status lines; only the message is substituted per call
+_STATUS_TEMPLATES = {
+    "listening": _status_template("🎙", _G),
+    "follow_up": _status_template("💬", _G),
+    "thinking":  _status_template("⏳", _Y),
+    "speaking":  _status_template("🔊", _C),
+    "warning":   _status_template("⚠", _Y),
+    "idle":      _status_template("💤", _DIM),
+    "sleeping":  _status_template("😴", _DIM),
+    "error":     _status_template("❌", _RED),
+}
+
+
+def _status(key: str, msg: str):
+    """Overwrite current line with the *key* status template and *msg*."""
+    with _TTY_LOCK:
+        sys.stdout.write(_STATUS_TEMPLATES[key] % msg)
+        sys.stdout.flush()
+
+
+def _report_error(e: Exception):
+    """Show an unexpected error; the full traceback only with NIA_DEBUG=1."""
+    with _TTY_LOCK:
+        _status("error", f"Error: {e}")
+        if os.environ.get("NIA_DEBUG"):
+            traceback.print_exc()
+        else:
+            sys.stderr.write("".join(traceback.format_exception_only(type(e), e)))
+
+
+# ── Thread priority ───────────────────────────────────────────────────────────
+
+_QOS_CLASS_USER_INTERACTIVE = 0x21
+
+
+@functools.cache
+def _libsystem() -> ctypes.CDLL | None:
+    try:
+        return ctypes.CDLL("/usr/lib/libSystem.dylib")
+    except OSError:
+        return None
+
+
+def _set_thread_qos(qos_class: int = _QOS_CLASS_USER_INTERACTIVE):
+    """Raise the calling thread's macOS QoS class so Spotlight, Time Machine
+    etc. are preempted before audio work. No-op on other platforms."""
+    if sys.platform != "darwin":
+        return
+    lib = _libsystem()
+    if lib is not None:
+        lib.pthread_set_qos_class_self_np(qos_class, 0)
+
+
+# ── Recording helpers ─────────────────────────────────────────────────────────
+
+_MIN_SPEECH_S = 0.1  # shorter recordings are treated as "nothing captured"
+
+
+def _too_short(wav_bytes: bytes) -> bool:
+    """True if a WAV blob holds less than _MIN_SPEECH_S of PCM.
+
+    Only a measured duration rejects a recording. A header the wave module
+    can't parse (e.g. WAVE_FORMAT_EXTENSIBLE before Python 3.12) is reported
+    and the audio is sent to the hub anyway; a blob too short to hold a
+    header at all counts as empty.
+    """
+    try:
+        with wave.open(io.BytesIO(wav_bytes), "rb") as wf:
+            rate = wf.getframerate()
+            return not rate or wf.getnframes() / rate < _MIN_SPEECH_S
+    except EOFError:
+        return True
+    except wave.Error as e:
+        _status("warning", f"Can't read WAV header ({e}) — sending anyway")
+        return False
+
+
+# ── Audio playback ────────────────────────────────────────────────────────────
+
+_PLAYER_PIPE_SIZE     = 1 << 20  # 1 MiB of headroom for bursty hub output
+_PLAYER_STALL_TIMEOUT = 2.0      # seconds the player may leave its pipe full
+
+
+def _write_all(fd: int, data: memoryview, sel: selectors.BaseSelector):
+    """Write all of *data* to a non-blocking fd, retrying on short writes.
 
+    *sel* must have *fd* registered for EVENT_WRITE (kqueue on macOS, epoll
+    on Linux). Raises TimeoutError if the reader leaves the pipe full for
+    longer than _PLAYER_STALL_TIMEOUT. Slicing a memoryview is zero-copy, so
+    a short write never re-allocates the unwritten tail.
+    """
+    while data:
+        try:
+            n = os.write(fd, data)
+        except BlockingIOError:
+            if not sel.select(_PLAYER_STALL_TIMEOUT):
+                raise TimeoutError("player stalled") from None
+            continue
+        data = data[n:]
 
-def _hr():
-    print(f"{_DIM}{'─' * 50}{_R}")
+
+def _shutdown_player(proc: subprocess.Popen, timeout: float = 2):
+    """Close the player's stdin and reap it: wait → terminate → kill.
+
+    *timeout* is how long to let it finish playing buffered audio; after that
+    the player gets one more second to honour SIGTERM before SIGKILL.
+    """
+    try:
+        proc.stdin.close()
+    except Exception:
+        pass
+    try:
+        proc.wait(timeout=timeout)
+        return
+    except subprocess.TimeoutExpired:
+        proc.terminate()
+    try:
+        proc.wait(timeout=1)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
 
 
 # ── MP3 player discovery ──────────────────────────────────────────────────────
 
+_PLAYER_CACHE = Path.home() / ".cache" / "nia-voice-mac" / "player.txt"
+
+# ffplay ships with ffmpeg (already installed for Kokoro TTS); mpv is a fallback
+_PLAYER_CANDIDATES = [
+    "/opt/homebrew/bin/ffplay", "ffplay",
+    "/opt/homebrew/bin/mpv", "mpv",
+]
+
+
+def _player_args(path: str) -> list[str]:
+    """Return the streaming command line for an ffplay or mpv binary."""
+    if Path(path).name.startswith("mpv"):
+        return [path, "--no-video", "--no-terminal", "--cache=no",
+                "--audio-buffer=0.05", "--untimed", "-"]
+    # Low-latency flags: start decoding on the first few bytes instead
+    # of buffering/probing the stream (adds ~1s before first audio).
+    # -avioflags direct is deliberately omitted — it breaks pipe input.
+    return [path, "-nodisp", "-autoexit",
+            "-fflags", "nobuffer", "-flags", "low_delay",
+            "-probesize", "32", "-analyzeduration", "0",
+            "-i", "pipe:0", "-loglevel", "quiet"]
+
+
 def _find_player() -> list[str]:
-    """Return the command list for the best available streaming MP3 player."""
-    # ffplay ships with ffmpeg (already installed for Kokoro TTS)
-    for candidate in ["/opt/homebrew/bin/ffplay", "ffplay"]:
-        try:
-            subprocess.run(
-                [candidate, "-version"],
-                capture_output=True,
-                check=True,
-            )
-            return [candidate, "-nodisp", "-autoexit", "-i", "pipe:0",
-                    "-loglevel", "quiet"]
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            pass
-    # mpv fallback
-    for candidate in ["/opt/homebrew/bin/mpv", "mpv"]:
-        try:
-            subprocess.run([candidate, "--version"], capture_output=True, check=True)
-            return [candidate, "--no-video", "--no-terminal", "--no-cache", "-"]
-        except (FileNotFoundError, subprocess.CalledProcessError):
-            pass
+    """Return the command list for the best available streaming MP3 player.
+
+    The chosen binary is cached in ~/.cache/nia-voice-mac/player.txt so later
+    starts only stat it instead of searching PATH again.
+    """
+    try:
+        cached = _PLAYER_CACHE.read_text().strip()
+        if cached and os.path.isfile(cached) and os.access(cached, os.X_OK):
+            return _player_args(cached)
+    except OSError:
+        pass  # no cache yet
+
+    for candidate in _PLAYER_CANDIDATES:
+        path = shutil.which(candidate)
+        if path:
+            try:
+                _PLAYER_CACHE.parent.mkdir(parents=True, exist_ok=True)
+                _PLAYER_CACHE.write_text(path + "\n")
+            except OSError:
+                pass  # read-only home — just probe again next time
+            return _player_args(path)
     return []
 
 
+# ── Wake word process ─────────────────────────────────────────────────────────
+
+def _wake_worker(conn: Connection, model: str):
+    """Child process: run openWakeWord and report detections over *conn*."""
+    from nia_voice_core.wakeword import OpenWakeWordEngine
+
+    signal.signal(signal.SIGINT, signal.SIG_IGN)  # the parent handles Ctrl-C
+    send_lock = threading.Lock()
+
+    def _send(msg: str):
+        with send_lock:
+            try:
+                conn.send(msg)
+            except OSError:
+                pass  # parent went away
+
+    engine = OpenWakeWordEngine(on_wake=lambda: _send("wake"), model=model)
+    if not engine.start():
+        _send("failed")
+        return
+    _send("ready")
+    try:
+        while True:
+            try:
+                msg = conn.recv()
+            except EOFError:
+                break  # parent exited without saying goodbye
+            if msg == "resume":
+                engine.resume()
+            elif msg == "stop":
+                break
+    finally:
+        engine.stop()
+
+
+class _WakeWordProcess:
+    """
+    OpenWakeWordEngine hosted in a child process.
+
+    The engine's InputStream and ONNX scoring run in their own interpreter, so
+    GC pauses and GIL contention here can't cause wake-word audio dropouts.
+    Exposes the same start/resume/stop interface; detections arrive over a
+    Pipe and *on_wake* is called from a listener thread.
+    """
+
+    _READY_TIMEOUT = 30  # seconds to load the model and open the mic
+
+    def __init__(self, on_wake: Callable[[], None], model: str):
+        self._on_wake   = on_wake
+        self._model     = model
+        self._conn: Connection | None = None
+        self._proc: multiprocessing.Process | None = None
+        self._send_lock = threading.Lock()
+
+    def start(self) -> bool:
+        ctx = multiprocessing.get_context("spawn")
+        self._conn, child_conn = ctx.Pipe()
+        self._proc = ctx.Process(
+            target=_wake_worker, args=(child_conn, self._model), daemon=True
+        )
+        self._proc.start()
+        child_conn.close()
+
+        try:
+            ready = (self._conn.poll(self._READY_TIMEOUT)
+                     and self._conn.recv() == "ready")
+        except EOFError:
+            ready = False
+        if not ready:
+            self.stop()
+            return False
+
+        threading.Thread(target=self._listen, daemon=True).start()
+        return True
+
+    def _listen(self):
+        while True:
+            try:
+                msg = self._conn.recv()
+            except (EOFError, OSError):
+                return
+            if msg == "wake":
+                self._on_wake()
+
+    def _send(self, msg: str):
+        with self._send_lock:
+            try:
+                self._conn.send(msg)
+            except OSError:
+                pass  # child already exited
+
+    def resume(self):
+        self._send("resume")
+
+    def stop(self):
+        if self._proc is None:
+            return
+        self._send("stop")
+        self._proc.join(timeout=2)
+        if self._proc.is_alive():
+            self._proc.terminate()
+        self._conn.close()
+        self._proc = None
+
+
 # ── Main client ───────────────────────────────────────────────────────────────
 
 class NiaMacClient:
@@ -116,19 +381,31 @@ class NiaMacClient:
     """
 
     def __init__(self, text_mode: bool = False, wake_model: str | None = None):
+        # Deferred until after arg parsing; main() sets PORTAUDIO_HOSTAPI
+        # before this point so sounddevice picks it up on import.
+        from nia_voice_core.hub import NiaHubClient
+        from nia_voice_core.mic import MicCapture
+
+        # One shared hub client for the whole session: voice, chat and fetch_*
+        # calls all go through this instance.
         self._hub         = NiaHubClient()
         self._mic         = MicCapture()           # sounddevice / CoreAudio
-        self._session_id  = uuid.uuid4().hex[:12]  # per-conversation context
+        self._session_id  = secrets.token_hex(6)   # per-conversation context
         self._processing  = False
         self._running     = False
         self._text_mode   = text_mode
         self._wake_model  = wake_model             # openWakeWord model name, or None
-        self._wake_engine: OpenWakeWordEngine | None = None
+        self._wake_engine: _WakeWordProcess | None = None
         self._player_cmd  = _find_player()
+        self._player_proc: subprocess.Popen | None = None  # current playback
+        # Terminal updates posted by worker threads, run by the main loop
+        self._ui_events: queue.SimpleQueue[Callable[[], None]] = queue.SimpleQueue()
 
     # ── Hub setup ─────────────────────────────────────────────────────────────
 
     def _connect(self):
+        from nia_voice_core.hub import NiaHubClient
+
         print(f"\n  Connecting to Nia Hub at {nia_config.NIA_HUB_URL} …")
         n = self._hub.connect_with_retry(max_retries=3)
         print(f"  {_G}✓{_R} {n} tools loaded")
@@ -140,8 +417,9 @@ class NiaMacClient:
         NiaHubClient.apply_device_config(cfg or {}, system_context=ctx)
         self._hub.reset_conversation()
 
-        if nia_config.NIA_ROOM:
-            print(f"  {_DIM}Room: {nia_config.NIA_ROOM}{_R}")
+        room = nia_config.NIA_ROOM  # read after apply_device_config may set it
+        if room:
+            print(f"  {_DIM}Room: {room}{_R}")
         if ai_cfg:
             model = ai_cfg.get("llm_model", "?")
             stt   = ai_cfg.get("stt_base_url", "openai")
@@ -153,12 +431,21 @@ class NiaMacClient:
     def _start_player(self) -> "subprocess.Popen | None":
         if not self._player_cmd:
             return None
-        return subprocess.Popen(
+        proc = subprocess.Popen(
             self._player_cmd,
             stdin=subprocess.PIPE,
             stdout=subprocess.DEVNULL,
             stderr=subprocess.DEVNULL,
         )
+        # Enlarge the pipe so hub bursts don't back-pressure the HTTP loop.
+        # F_SETPIPE_SZ is Linux-only; macOS pipes grow on demand.
+        set_pipe_sz = getattr(fcntl, "F_SETPIPE_SZ", None)
+        if set_pipe_sz is not None:
+            try:
+                fcntl.fcntl(proc.stdin.fileno(), set_pipe_sz, _PLAYER_PIPE_SIZE)
+            except OSError:
+                pass  # above /proc/sys/fs/pipe-max-size — keep the default
+        return proc
 
     # ── Wake word ─────────────────────────────────────────────────────────────
 
@@ -175,7 +462,7 @@ class NiaMacClient:
         return any(p in lower for p in self._GOODBYE)
 
     def _on_wake_detected(self):
-        """Called by OpenWakeWordEngine when the wake word fires."""
+        """Called (via _WakeWordProcess) when the wake word fires."""
         if self._processing:
             if self._wake_engine:
                 self._wake_engine.resume()
@@ -200,29 +487,31 @@ class NiaMacClient:
         of silence, a goodbye phrase, or an error.
         """
         self._processing = True
+        _set_thread_qos()
         try:
             # ── First turn ────────────────────────────────────────────────
-            _status("🎙", _G, "Listening… (speak now, stops on silence)")
+            _status("listening", "Listening… (speak now, stops on silence)")
             wav = self._mic.record(auto_stop=True)
-            if len(wav) < 2500:
-                _status("💤", _DIM, "Nothing captured")
+            if _too_short(wav):
+                _status("idle", "Nothing captured")
                 return
 
             transcript, reply = self._run_pipeline(wav)
             if not transcript:
                 return
             if self._is_goodbye(transcript) or self._is_goodbye(reply):
-                print(f"  {_DIM}Conversation ended.{_R}\n")
+                with _TTY_LOCK:
+                    print(f"  {_DIM}Conversation ended.{_R}\n")
                 return
 
             # ── Follow-up turns ───────────────────────────────────────────
             deadline = time.monotonic() + self._FOLLOW_UP_TIMEOUT
             while time.monotonic() < deadline:
                 remaining = int(deadline - time.monotonic())
-                _status("💬", _G, f"Still listening… ({remaining}s to exit)")
+                _status("follow_up", f"Still listening… ({remaining}s to exit)")
 
                 wav = self._mic.record(auto_stop=True)
-                if len(wav) < 2500:
+                if _too_short(wav):
                     continue  # silence chunk — let the timer run down
 
                 transcript, reply = self._run_pipeline(wav)
@@ -231,66 +520,109 @@ class NiaMacClient:
 
                 deadline = time.monotonic() + self._FOLLOW_UP_TIMEOUT  # reset
                 if self._is_goodbye(transcript) or self._is_goodbye(reply):
-                    print(f"  {_DIM}Conversation ended.{_R}\n")
+                    with _TTY_LOCK:
+                        print(f"  {_DIM}Conversation ended.{_R}\n")
                     break
 
-            _status("😴", _DIM, "Back to wake word…")
-            print()
+            with _TTY_LOCK:
+                _status("sleeping", "Back to wake word…")
+                print()
 
         except Exception as e:
-            _status("❌", _RED, f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            _report_error(e)
         finally:
             self._processing = False
-            self._prompt()
+            self._ui_events.put(self._prompt)
 
     # ── Voice pipeline ────────────────────────────────────────────────────────
 
+    # Recording is not yet overlapped with STT: MicCapture.record() returns the
+    # whole utterance before the POST starts. Streaming 100 ms PCM chunks with
+    # chunked transfer encoding needs a record_stream() iterator in
+    # nia_voice_core.mic and iterator upload support in
+    # NiaHubClient.voice_pipeline; once both exist, _run_voice and
+    # _run_conversation can pass the iterator through.
+
     def _run_voice(self):
         """Record → stream to hub (STT+LLM+TTS) → play MP3."""
         self._processing = True
+        _set_thread_qos()
         try:
-            _status("🎙", _G, "Listening… (speak now, stops on silence)")
+            _status("listening", "Listening… (speak now, stops on silence)")
 
             wav_bytes = self._mic.record(auto_stop=True)
 
-            # Reject very short recordings (< ~0.1 s of audio after WAV header)
-            if len(wav_bytes) < 2500:
-                _status("💤", _DIM, "Nothing captured")
+            # Reject very short recordings (< 0.1 s of PCM, per the WAV header)
+            if _too_short(wav_bytes):
+                _status("idle", "Nothing captured")
                 return
 
             self._run_pipeline(wav_bytes)
 
         except Exception as e:
-            _status("❌", _RED, f"Error: {e}")
-            import traceback
-            traceback.print_exc()
+            _report_error(e)
         finally:
             self._processing = False
-            self._prompt()
+            self._ui_events.put(self._prompt)
 
     def _run_pipeline(self, wav_bytes: bytes):
         """POST WAV to hub, stream MP3 response to player."""
-        _status("⏳", _Y, "Thinking (hub: STT → LLM → TTS)…")
-
-        player_proc = None
-        first_chunk  = True
-
-        def _on_chunk(chunk: bytes):
-            nonlocal player_proc, first_chunk
+        _status("thinking", "Thinking (hub: STT → LLM → TTS)…")
+
+        # Spawn the player now so its stdin is open before the first MP3 byte
+        # arrives — ffplay idles on an empty pipe while the hub is thinking.
+        # A missing player is reported once at startup (see start()).
+        player_proc = self._player_proc = self._start_player()
+        completed   = False
+        # Write straight to the raw fd — skips BufferedWriter's extra copy.
+        # Non-blocking, so a wedged player trips the writer's watchdog instead
+        # of hanging it in os.write().
+        stdin_fd    = player_proc.stdin.fileno() if player_proc else -1
+        if player_proc:
+            os.set_blocking(stdin_fd, False)
+        player_open = player_proc is not None
+        first_chunk = True
+
+        # The hub iterator only enqueues; a writer thread drains into the
+        # player so pipe back-pressure never stalls the HTTPS read loop.
+        chunks: queue.Queue[memoryview | None] = queue.Queue(maxsize=8)
+
+        def _writer():
+            # Sole user of stdin_fd: the pipeline only closes it after this
+            # thread exits, by which time the selector has released the fd.
+            nonlocal player_open
+            _set_thread_qos()
+            with selectors.DefaultSelector() as sel:
+                sel.register(stdin_fd, selectors.EVENT_WRITE)
+                while (chunk := chunks.get()) is not None:
+                    if not player_open:
+                        continue  # keep draining so the producer never blocks
+                    try:
+                        _write_all(stdin_fd, chunk, sel)
+                    except TimeoutError:
+                        if player_open:  # not already abandoned by the pipeline
+                            _status("warning", "Player stalled — skipping the rest of the reply")
+                        player_open = False
+                        player_proc.kill()
+                    except OSError:
+                        player_open = False  # player exited — drop the rest
+
+        writer = None
+        if player_proc:
+            writer = threading.Thread(target=_writer, daemon=True)
+            writer.start()
+
+        def _on_chunk(chunk: bytes | memoryview):
+            nonlocal first_chunk
             if first_chunk:
                 first_chunk = False
-                _status("🔊", _C, "Speaking…")
-                player_proc = self._start_player()
-                if player_proc is None:
-                    print(f"\n  {_RED}⚠  No MP3 player found."
-                          f" Run: brew install ffmpeg{_R}")
-            if player_proc and player_proc.stdin and not player_proc.stdin.closed:
-                try:
-                    player_proc.stdin.write(chunk)
-                except BrokenPipeError:
-                    pass
+                _status("speaking", "Speaking…")
+            if player_open:
+                # Queued as a view so _write_all can slice off a short write
+                # without copying the tail. The view outlives this callback,
+                # so the hub must pass a fresh buffer per chunk — a reused
+                # buffer would overwrite audio still waiting in the queue.
+                chunks.put(memoryview(chunk))
 
         try:
             transcript, reply = self._hub.voice_pipeline(
@@ -298,26 +630,36 @@ class NiaMacClient:
                 session_id=self._session_id,
                 on_audio_chunk=_on_chunk,
             )
+            completed = True
         finally:
-            # Always close player gracefully
+            # Always close player gracefully. The writer owns stdin_fd until
+            # it exits, so stdin is only closed once it has been joined.
             if player_proc:
-                try:
-                    player_proc.stdin.close()
-                except Exception:
-                    pass
-                try:
-                    player_proc.wait(timeout=30)
-                except subprocess.TimeoutExpired:
+                if not completed:
+                    player_open = False  # broken stream — drop what's queued
+                chunks.put(None)
+                # A complete reply is fed in full (the writer's stall watchdog
+                # bounds this); a broken one gets a short grace, then the
+                # player is killed so a pending write fails with EPIPE.
+                writer.join(timeout=None if completed else 2)
+                if writer.is_alive():
                     player_proc.kill()
+                    writer.join()
+                # A full reply may still be playing from the pipe, so allow up
+                # to 30 s; a broken stream only gets a short grace.
+                _shutdown_player(player_proc, timeout=30 if completed else 2)
+                self._player_proc = None
 
         # Print transcript + reply
-        print()
         if transcript:
-            print(f"  {_DIM}You:{_R} {transcript}")
-            print(f"  {_C}{_B}Nia:{_R} {reply}")
+            with _TTY_LOCK:
+                print(f"\n  {_DIM}You:{_R} {transcript}\n"
+                      f"  {_C}{_B}Nia:{_R} {reply}\n")
         else:
-            _status("💤", _DIM, "Nothing transcribed (silence?)")
-        print()
+            with _TTY_LOCK:
+                print()
+                _status("idle", "Nothing transcribed (silence?)")
+                print()
         return transcript, reply
 
     # ── Text pipeline (--text mode) ───────────────────────────────────────────
@@ -330,56 +672,68 @@ class NiaMacClient:
         """
         self._processing = True
         try:
-            print(f"\n  {_DIM}→ {text}{_R}")
-            _status("⏳", _Y, "Thinking (hub: LLM + tool calls)…")
+            with _TTY_LOCK:
+                print(f"\n  {_DIM}→ {text}{_R}")
+                _status("thinking", "Thinking (hub: LLM + tool calls)…")
 
             reply = self._hub.chat(text)
 
-            print()
-            print(f"  {_C}{_B}Nia:{_R} {reply}")
-            print()
+            with _TTY_LOCK:
+                print(f"\n  {_C}{_B}Nia:{_R} {reply}\n")
 
         except Exception as e:
-            _status("❌", _RED, f"Error: {e}")
+            _status("error", f"Error: {e}")
         finally:
             self._processing = False
-            self._prompt()
+            self._ui_events.put(self._prompt)
 
     # ── UI helpers ────────────────────────────────────────────────────────────
 
     def _prompt(self):
-        if self._text_mode:
-            print(f"  {_DIM}> {_R}", end="", flush=True)
-        elif self._wake_engine:
-            print(
-                f"  {_DIM}Say '{self._wake_model}' to speak  "
-                f"[Enter] manual  [r] reset  [q] quit{_R}"
-            )
-        else:
-            print(
-                f"  {_DIM}[Enter] speak  "
-                f"[r] reset  "
-                f"[t <text>] inline text  "
-                f"[q] quit{_R}"
-            )
+        with _TTY_LOCK:
+            if self._text_mode:
+                print(f"  {_DIM}> {_R}", end="", flush=True)
+            elif self._wake_engine:
+                print(
+                    f"  {_DIM}Say '{self._wake_model}' to speak  "
+                    f"[Enter] manual  [r] reset  [q] quit{_R}"
+                )
+            else:
+                print(
+                    f"  {_DIM}[Enter] speak  "
+                    f"[r] reset  "
+                    f"[t <text>] inline text  "
+                    f"[q] quit{_R}"
+                )
+
+    def _drain_ui_events(self):
+        """Run terminal updates queued by worker threads (main thread only)."""
+        while True:
+            try:
+                event = self._ui_events.get_nowait()
+            except queue.Empty:
+                return
+            event()
 
     # ── Lifecycle ─────────────────────────────────────────────────────────────
 
     def start(self):
         """Connect to hub and run the interactive loop."""
-        print(f"\n{_B}{'=' * 50}")
-        print("  Nia Voice Mac  v1.0")
-        print(f"{'=' * 50}{_R}")
-
+        banner = [f"\n{_B}{'=' * 50}", "  Nia Voice Mac  v1.0", f"{'=' * 50}{_R}"]
         if _ENV_PATH:
-            print(f"  {_DIM}Config: {_ENV_PATH}{_R}")
+            banner.append(f"  {_DIM}Config: {_ENV_PATH}{_R}")
+        print("\n".join(banner))
+
+        hub_url = nia_config.NIA_HUB_URL
+        api_key = nia_config.NIA_API_KEY
+        cert    = nia_config.NIA_HUB_CERT
 
         # Validate required env vars before attempting connection
-        if not nia_config.NIA_HUB_URL:
+        if not hub_url:
             print(f"\n  {_RED}Error: NIA_HUB_URL is not set.{_R}")
             print(f"  Create a .env file (see env.example) or use --hub URL")
             return
-        if not nia_config.NIA_API_KEY:
+        if not api_key:
             print(f"\n  {_RED}Error: NIA_API_KEY is not set.{_R}")
             print(f"  Create a .env file (see env.example) or use --key KEY")
             return
@@ -389,7 +743,7 @@ class NiaMacClient:
             self._connect()
         except Exception as e:
             print(f"\n  {_RED}Hub connection failed: {e}{_R}")
-            print(f"  Is the hub running? Check NIA_HUB_URL={nia_config.NIA_HUB_URL}")
+            print(f"  Is the hub running? Check NIA_HUB_URL={hub_url}")
             return
 
         # Warn if no MP3 player
@@ -399,89 +753,128 @@ class NiaMacClient:
 
         # Start wake word engine if requested
         if self._wake_model and not self._text_mode:
-            self._wake_engine = OpenWakeWordEngine(
+            self._wake_engine = _WakeWordProcess(
                 on_wake=self._on_wake_detected,
                 model=self._wake_model,
             )
             if not self._wake_engine.start():
                 self._wake_engine = None
 
-        _hr()
         if self._wake_engine:
             mode = f"wake:{self._wake_model}"
         elif self._text_mode:
             mode = "text"
         else:
             mode = "voice"
-        cert = "✓ cert pinned" if nia_config.NIA_HUB_CERT else "unverified TLS"
-        print(f"  {_G}Ready!{_R}  mode={mode}  session={self._session_id[:8]}  {_DIM}({cert}){_R}")
-        _hr()
-        print()
+        tls   = "✓ cert pinned" if cert else "unverified TLS"
+        ready = f"  {_G}Ready!{_R}  mode={mode}  session={self._session_id[:8]}  {_DIM}({tls}){_R}"
+        print("\n".join([_HR, ready, _HR, ""]))
 
         self._running = True
-        signal.signal(signal.SIGINT, lambda *_: self.stop())
-        signal.signal(signal.SIGTERM, lambda *_: self.stop())
+        signal.signal(signal.SIGINT, self._on_signal)
+        signal.signal(signal.SIGTERM, self._on_signal)
 
         self._prompt()
 
-        while self._running:
-            try:
-                line = input()
-            except (EOFError, KeyboardInterrupt):
-                break
+        # Poll stdin instead of blocking in input() so the main thread can
+        # also flush UI events posted by worker threads between keystrokes.
+        # Read the raw fd and split lines here: a buffered readline() could
+        # swallow several pasted/piped lines that select() then never reports.
+        # SelectSelector, not DefaultSelector: epoll refuses /dev/null and
+        # regular files (--text < cmds.txt, service managers), select() doesn't.
+        stdin_fd = -1
+        pending  = b""
+        sel = selectors.SelectSelector()
+        try:
+            stdin_fd = sys.stdin.fileno()
+            sel.register(stdin_fd, selectors.EVENT_READ)
+        except (AttributeError, OSError, ValueError):
+            self._running = False  # missing/unwatchable stdin — like EOF
+        try:
+            while self._running:
+                self._drain_ui_events()
+                if not sel.select(timeout=0.1):
+                    continue
+                data = os.read(stdin_fd, 4096)
+                if not data:  # EOF — an unterminated last line still counts
+                    if pending:
+                        self._handle_command(pending.decode(errors="replace").strip())
+                    break
+                *lines, pending = (pending + data).split(b"\n")
+                for line in lines:
+                    if not self._handle_command(line.decode(errors="replace").strip()):
+                        self._running = False
+                        break
+        finally:
+            sel.close()
+
+        self.stop()
 
-            cmd   = line.strip()
-            lower = cmd.lower()
+    def _handle_command(self, cmd: str) -> bool:
+        """Dispatch one line of input. Returns False when the user quits."""
+        lower = cmd.lower()
 
-            # ── Global commands ──────────────────────────────────────────────
-            if lower in ("q", "quit", "exit"):
-                break
+        # ── Global commands ──────────────────────────────────────────────────
+        if lower in ("q", "quit", "exit"):
+            return False
 
-            if lower in ("r", "reset"):
-                self._session_id = uuid.uuid4().hex[:12]
-                self._hub.reset_conversation()
+        if lower in ("r", "reset"):
+            self._session_id = secrets.token_hex(6)
+            self._hub.reset_conversation()
+            with _TTY_LOCK:
                 print(f"  {_G}Conversation reset.{_R}"
                       f"  New session: {self._session_id[:8]}")
-                self._prompt()
-                continue
+            self._prompt()
+            return True
 
-            if self._processing:
+        if self._processing:
+            with _TTY_LOCK:
                 print(f"  {_Y}Still processing — please wait…{_R}")
+            self._prompt()
+            return True
+
+        # ── Text injection: "t hello" (works in both modes) ──────────────────
+        if lower.startswith("t ") and len(cmd) > 2:
+            text = cmd[2:].strip()
+            if text:
+                t = threading.Thread(
+                    target=self._run_text, args=(text,), daemon=True
+                )
+                t.start()
+                return True
+
+        # ── Text mode: any input is a command ────────────────────────────────
+        if self._text_mode:
+            if cmd:
+                t = threading.Thread(
+                    target=self._run_text, args=(cmd,), daemon=True
+                )
+                t.start()
+            else:
                 self._prompt()
-                continue
-
-            # ── Text injection: "t hello" (works in both modes) ──────────────
-            if lower.startswith("t ") and len(cmd) > 2:
-                text = cmd[2:].strip()
-                if text:
-                    t = threading.Thread(
-                        target=self._run_text, args=(text,), daemon=True
-                    )
-                    t.start()
-                    continue
+            return True
 
-            # ── Text mode: any input is a command ────────────────────────────
-            if self._text_mode:
-                if cmd:
-                    t = threading.Thread(
-                        target=self._run_text, args=(cmd,), daemon=True
-                    )
-                    t.start()
-                else:
-                    self._prompt()
-                continue
-
-            # ── Voice mode: Enter = record ────────────────────────────────────
-            t = threading.Thread(target=self._run_voice, daemon=True)
-            t.start()
+        # ── Voice mode: Enter = record ────────────────────────────────────────
+        t = threading.Thread(target=self._run_voice, daemon=True)
+        t.start()
+        return True
 
-        self.stop()
+    def _on_signal(self, *_):
+        """SIGINT/SIGTERM: end the main loop, which then calls stop()."""
+        self._running = False
 
     def stop(self):
         self._running = False
-        if self._wake_engine:
-            self._wake_engine.stop()
-            self._wake_engine = None
+        try:
+            if self._wake_engine:
+                self._wake_engine.stop()
+                self._wake_engine = None
+        finally:
+            # Don't leave ffplay/mpv running if we quit mid-reply. Only kill
+            # it: the pipeline thread closes stdin once its writer has exited.
+            player_proc = self._player_proc
+            if player_proc:
+                player_proc.kill()
         print(f"\n  {_DIM}Goodbye!{_R}")
 
 